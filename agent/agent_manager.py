@@ -1,15 +1,16 @@
 import os
 from typing import Dict, Any
-from core.config import settings
+from core.config import get_settings
 from agent.strategy.wrapper import JSONWrapper, MDWrapper
 from agent.providers.base import Provider, EmbeddingProvider
 
 class AgentManager:
     def __init__(self,
                  strategy: str | None = None,
-                 model: str = settings.LL_MODEL,
-                 model_provider: str = settings.LLM_PROVIDER
+                 model: str | None = None,
+                 model_provider: str | None = None
                  ) -> None:
+        settings = get_settings()
         match strategy:
             case "md":
                 self.strategy = MDWrapper()
@@ -17,8 +18,8 @@ class AgentManager:
                 self.strategy = JSONWrapper()
             case _:
                 self.strategy = JSONWrapper()
-        self.model = model
-        self.model_provider = model_provider
+        self.model = model or settings.LL_MODEL
+        self.model_provider = model_provider or settings.LLM_PROVIDER
 
     async def _get_provider(self, **kwargs: Any) -> Provider:
         # Default options for any LLM. Not all can handle them
@@ -31,6 +32,7 @@ class AgentManager:
             "num_ctx": 20000
         }
         opts.update(kwargs)
+        settings = get_settings()
         match self.model_provider:
             case 'openai':
                 from .providers.openai import OpenAIProvider
@@ -62,14 +64,16 @@ class AgentManager:
 
 class EmbeddingManager:
     def __init__(self,
-                 model: str = settings.EMBEDDING_MODEL,
-                 model_provider: str = settings.EMBEDDING_PROVIDER) -> None:
-        self._model = model
-        self._model_provider = model_provider
+                 model: str | None = None,
+                 model_provider: str | None = None) -> None:
+        settings = get_settings()
+        self._model = model or settings.EMBEDDING_MODEL
+        self._model_provider = model_provider or settings.EMBEDDING_PROVIDER
 
     async def _get_embedding_provider(
         self, **kwargs: Any
     ) -> EmbeddingProvider:
+        settings = get_settings()
         match self._model_provider:
             case 'openai':
                 from .providers.openai import OpenAIEmbeddingProvider
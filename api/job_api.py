@@ -2,12 +2,14 @@ import logging
 import traceback
 
 from uuid import uuid4
+from typing import Any, Callable, Dict, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import APIRouter, HTTPException, Depends, Request, status, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from fastapi_cache.decorator import cache
 
 from core.database import get_db_session
-from service.job_service import JobService
+from service.job_service import JobService, get_job_service
 from exception import JobNotFoundError
 from schema.pydantic.job_request_pydantic import JobUploadRequest
 
@@ -15,6 +17,34 @@ job_router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+def job_id_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Any = None,
+    response: Any = None,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> str:
+    """
+    Cache key built from ``job_id`` alone. The default builder would fold in
+    the service instance and the per-request ``AsyncSession``, which never
+    repeat and would make every lookup a miss.
+    """
+    return f"{namespace}:{kwargs['job_id']}"
+
+
+async def _fetch_job_data(
+    job_service: JobService, db: AsyncSession, *, job_id: str
+) -> Optional[Dict]:
+    return await job_service.get_job_with_processed_data(db, job_id=job_id)
+
+
+_fetch_job_data_cached = cache(
+    namespace="job", expire=3600, key_builder=job_id_key_builder
+)(_fetch_job_data)
+
+
 @job_router.post(
     "/upload",
     summary="stores the job posting in the database by parsing the JD into a structured format JSON",
@@ -23,30 +53,14 @@ async def upload_job(
     payload: JobUploadRequest,
     request: Request,
     db: AsyncSession = Depends(get_db_session),
+    job_service: JobService = Depends(get_job_service),
 ):
     """
     Accepts a job description as a MarkDown text and stores it in the database.
     """
     request_id = getattr(request.state, "request_id", str(uuid4()))
 
-    # --- START OF VERIFICATION LOGGING ---
-
-    # 1. Log the payload as received by FastAPI (as a Pydantic object)
-    logger.info("--- DATA VERIFICATION STEP 1: PAYLOAD AS Pydantic Model ---")
-    logger.info(f"Received payload object: {payload}")
-    logger.info(f"Type of received payload: {type(payload)}")
-    logger.info("---------------------------------------------------------")
-
-    # 2. Convert the Pydantic model to a standard Python dictionary
-    job_data_dict = payload.model_dump()
-
-    # 3. Log the resulting dictionary to see its final form before passing it on
-    logger.info("--- DATA VERIFICATION STEP 2: PAYLOAD AS Python Dictionary ---")
-    logger.info(f"Payload after model_dump(): {job_data_dict}")
-    logger.info(f"Type of payload after model_dump(): {type(job_data_dict)}")
-    logger.info("------------------------------------------------------------")
-
-    # --- END OF VERIFICATION LOGGING ---
+    logger.debug("Received job upload payload: %r", payload)
 
     allowed_content_types = [
         "application/json",
@@ -66,8 +80,7 @@ async def upload_job(
         )
 
     try:
-        job_service = JobService(db)
-        job_ids = await job_service.create_and_store_job(payload.model_dump())
+        job_ids = await job_service.create_and_store_job(db, payload)
 
     except AssertionError as e:
         raise HTTPException(
@@ -99,6 +112,7 @@ async def get_job(
     request: Request,
     job_id: str = Query(..., description="Job ID to fetch data for"),
     db: AsyncSession = Depends(get_db_session),
+    job_service: JobService = Depends(get_job_service),
 ):
     """
     Retrieves job data from both job_model and processed_job model by job_id.
@@ -122,17 +136,20 @@ async def get_job(
                 detail="job_id is required",
             )
 
-        job_service = JobService(db)
-        job_data = await job_service.get_job_with_processed_data(
-            job_id=job_id
-        )
+        # Only go through the cache once the lifespan has set up a backend;
+        # scripts and tests that skip it fall back to a plain lookup.
+        if getattr(request.app.state, "job_cache_enabled", False):
+            fetch_job_data = _fetch_job_data_cached
+        else:
+            fetch_job_data = _fetch_job_data
+        job_data = await fetch_job_data(job_service, db, job_id=job_id)
         
         if not job_data:
             raise JobNotFoundError(
                 message=f"Job with id {job_id} not found"
             )
 
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "request_id": request_id,
                 "data": job_data,
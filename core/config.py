@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 import sys
 import logging
@@ -14,6 +15,12 @@ class Settings(BaseSettings):
     FRONTEND_PATH: str = os.path.join(os.path.dirname(__file__), "frontend", "assets")
     ALLOWED_ORIGINS: List[str] = ["http://localhost:3000", "http://127.0.0.1:3000"]
     DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_PGBOUNCER_TRANSACTION_MODE: bool = False
     PYTHONDONTWRITEBYTECODE: int = 1
     SYNC_DATABASE_URL: Optional[str] = None
     ASYNC_DATABASE_URL: Optional[str] = None
@@ -26,6 +33,8 @@ class Settings(BaseSettings):
     EMBEDDING_API_KEY: Optional[str] = None
     EMBEDDING_BASE_URL: Optional[str] = None
     EMBEDDING_MODEL: Optional[str] = "dengcao/Qwen3-Embedding-0.6B:Q8_0"
+    LLM_CONCURRENCY: int = 4
+    REDIS_URL: Optional[str] = None
 
     # Updated model_config to use PROJECT_ROOT
     model_config = SettingsConfigDict(
@@ -34,32 +43,18 @@ class Settings(BaseSettings):
         extra="ignore",
     )
 
-# DEBUG before creating settings instance
-
-print("----DEBUGGING STARTS HERE----")
-
-env_path = PROJECT_ROOT / ".env"
-print(f"DEBUG: Looking for .env at: {env_path}")
-print(f"DEBUG: .env exists: {env_path.exists()}")
-print(f"DEBUG: PROJECT_ROOT: {PROJECT_ROOT}")
-print(f"DEBUG: __file__: {__file__}")
-
-if env_path.exists():
-    print(f"DEBUG: .env file content:")
-    with open(env_path, "r") as f:
-        for line in f:
-            if line.strip() and not line.startswith("#"):
-                key = line.split("=")[0] if '=' in line else line
-                print(f" {key}")
-
-settings = Settings()
-
-# DEBUG: Print after creating settings
-print(f"DEBUG: SYNC_DATABASE_URL: {settings.SYNC_DATABASE_URL}")
-print(f"DEBUG: ASYNC_DATABASE_URL: {settings.ASYNC_DATABASE_URL}")
-print(f"DEBUG: DB_ECHO: {settings.DB_ECHO}")
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Build the ``Settings`` on first use and reuse it afterwards.
 
-print("----DEBUGGING ENDS HERE----")
+    Callers invoke this directly, so FastAPI dependency overrides don't
+    apply. To change settings in tests, set environment variables and call
+    ``get_settings.cache_clear()``. Note that ``core.database`` builds its
+    engines at import, so engine-related settings must be in place before
+    that module is imported.
+    """
+    return Settings()
 
 _LEVEL_BY_ENV: dict[Literal["production", "staging", "local"], int] = {
     "production": logging.INFO,
@@ -80,6 +75,7 @@ def setup_logging() -> None:
     if root.handlers:
         return
 
+    settings = get_settings()
     env = settings.ENV.lower() if hasattr(settings, "ENV") else "production"
     level = _LEVEL_BY_ENV.get(env, logging.INFO)
 
@@ -95,4 +91,34 @@ def setup_logging() -> None:
     root.addHandler(handler)
 
     for noisy in ("sqlalchemy.engine", "uvicorn.access"):
-        logging.getLogger(noisy).setLevel(logging.WARNING)
\ No newline at end of file
+        logging.getLogger(noisy).setLevel(logging.WARNING)
+
+    if os.getenv("RESUME_SCANNER_DIAG"):
+        _diagnose()
+
+
+def _diagnose() -> None:
+    """
+    Log where settings were loaded from. Opt-in via ``RESUME_SCANNER_DIAG``.
+
+    Only key names and URL schemes are logged, never values.
+    """
+    logger = logging.getLogger(__name__)
+    settings = get_settings()
+    env_path = PROJECT_ROOT / ".env"
+    logger.debug("PROJECT_ROOT: %s", PROJECT_ROOT)
+    logger.debug(".env path: %s (exists: %s)", env_path, env_path.exists())
+
+    if env_path.exists():
+        with open(env_path, "r", encoding="utf-8") as f:
+            keys = [
+                line.split("=", 1)[0].strip()
+                for line in f
+                if line.strip() and not line.startswith("#")
+            ]
+        logger.debug(".env keys: %s", ", ".join(keys))
+
+    for name in ("SYNC_DATABASE_URL", "ASYNC_DATABASE_URL"):
+        url = getattr(settings, name)
+        logger.debug("%s scheme: %s", name, url.split("://", 1)[0] if url else None)
+    logger.debug("DB_ECHO: %s", settings.DB_ECHO)
\ No newline at end of file
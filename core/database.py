@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 from functools import lru_cache
 from typing import AsyncGenerator, Generator, Optional
+from uuid import uuid4
 
 from sqlalchemy import event, create_engine
 from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -12,9 +16,11 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
-from core.config import settings 
+from core.config import get_settings
 from database.base import Base
 
+logger = logging.getLogger(__name__)
+
 # class _DatabaseSettings:
 #     """Pulled from environment once at import-time."""
 
@@ -33,9 +39,48 @@ def _get_connect_args(database_url: str) -> dict:
     """Get connection arguents based on database URL."""
     if database_url and database_url.startswith("sqlite"):
         return {"check_same_thread": False}
+    if database_url and database_url.startswith("postgresql+asyncpg"):
+        settings = get_settings()
+        if settings.DB_PGBOUNCER_TRANSACTION_MODE:
+            # PgBouncer's transaction pooling moves us between backend
+            # connections, so cached statements can't be reused and asyncpg's
+            # sequential statement names would collide; give each a unique name.
+            return {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+        # Otherwise keep a small cache for the handful of templated queries
+        # we repeat.
+        return {
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        }
     return {}
 
 
+def _get_pool_kwargs(database_url: str) -> dict:
+    """
+    Get connection pool sizing based on database URL.
+
+    SQLite keeps SQLAlchemy's default pool, since it has no server-side
+    connections worth multiplexing. Elsewhere the pool hands out the most
+    recently returned connection first (LIFO), so bursts reuse a few warm
+    connections and the rest can idle.
+    """
+    if database_url and database_url.startswith("sqlite"):
+        return {}
+    settings = get_settings()
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_use_lifo": True,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+
 def _configure_sqlite(engine: Engine) -> None:
     """
     For SQLite:
@@ -58,6 +103,8 @@ def _configure_sqlite(engine: Engine) -> None:
 @lru_cache(maxsize=1)
 def _make_sync_engine() -> Engine:
 
+    settings = get_settings()
+
     """Check if SYNC_DATABASE_URL is set."""
     if not settings.SYNC_DATABASE_URL:
         raise ValueError("SYNC_DATABASE_URL is not set in the configuration.")
@@ -77,6 +124,8 @@ def _make_sync_engine() -> Engine:
 @lru_cache(maxsize=1)
 def _make_async_engine() -> AsyncEngine:
 
+    settings = get_settings()
+
     """Check if ASYNC_DATABASE_URL is set."""
     if not settings.ASYNC_DATABASE_URL:
         raise ValueError("ASYNC_DATABASE_URL is not set in the configuration.")
@@ -88,6 +137,7 @@ def _make_async_engine() -> AsyncEngine:
         pool_pre_ping=True,
         connect_args=_get_connect_args(settings.ASYNC_DATABASE_URL),
         future=True,
+        **_get_pool_kwargs(settings.ASYNC_DATABASE_URL),
     )
     _configure_sqlite(engine.sync_engine)
     return engine
@@ -108,6 +158,7 @@ SessionLocal: sessionmaker[Session] = sessionmaker(
 
 AsyncSessionLocal: async_sessionmaker[AsyncSession] = async_sessionmaker(
     bind=async_engine,
+    autoflush=False,
     expire_on_commit=False,
 )
 
@@ -131,10 +182,16 @@ def get_sync_db_session() -> Generator[Session, None, None]:
 
 
 async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Yield an ``AsyncSession`` for one request.
+
+    Does not commit: write paths commit their own unit of work. Anything
+    left uncommitted, including the implicit transaction a read-only request
+    opens, is rolled back when the session closes. Also rolls back on error.
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -143,3 +200,32 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
 async def init_models(Base: Base) -> None:
     async with async_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+
+async def warm_up_pool() -> None:
+    """
+    Open the pool's connections before traffic arrives, so early requests
+    don't each pay the connect/auth handshake. SQLite only needs one.
+    """
+    settings = get_settings()
+    if settings.ASYNC_DATABASE_URL.startswith("sqlite"):
+        size = 1
+    else:
+        size = settings.DB_POOL_SIZE
+    results = await asyncio.gather(
+        *(async_engine.connect() for _ in range(size)), return_exceptions=True
+    )
+    # Hand back every connection that did open so none leak.
+    await asyncio.gather(
+        *(conn.close() for conn in results if not isinstance(conn, BaseException))
+    )
+    # A partial fill (e.g. max_connections below DB_POOL_SIZE x workers) isn't
+    # fatal: the pool still works, it just opens the rest on demand.
+    failures = [r for r in results if isinstance(r, BaseException)]
+    if failures:
+        logger.warning(
+            "Pool warm-up opened %d of %d connections; first error: %r",
+            size - len(failures),
+            size,
+            failures[0],
+        )
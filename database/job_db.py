@@ -1,11 +1,24 @@
 from sqlalchemy.types import JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy import Column, String, Text, Integer, ForeignKey, DateTime, text
 from database.base import Base
 from database.job_resume_association import job_resume_association
 
+# JSONB on Postgres, plain JSON elsewhere (e.g. SQLite)
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
 
 class ProcessedJob(Base):
+    """
+    Migration note: the structured columns below used to hold json.dumps'd
+    text (company_profile was a Text column, the rest JSON columns wrapping a
+    string, some as ``{"<field>": [...]}``). ``create_all`` does not alter
+    existing tables, so a database created before this change keeps the old
+    column types and rows. Drop and recreate ``processed_jobs`` (and
+    re-upload the jobs) or migrate it by hand before deploying.
+    """
+
     __tablename__ = "processed_jobs"
 
     job_id = Column(
@@ -15,16 +28,16 @@ class ProcessedJob(Base):
         index=True,
     )
     job_title = Column(String, nullable=False)
-    company_profile = Column(Text, nullable=True)
+    company_profile = Column(JSONType, nullable=True)
     location = Column(String, nullable=True)
     date_posted = Column(String, nullable=True)
     employment_type = Column(String, nullable=True)
     job_summary = Column(Text, nullable=False)
-    key_responsibilities = Column(JSON, nullable=True)
-    qualifications = Column(JSON, nullable=True)
-    compensation_and_benfits = Column(JSON, nullable=True)
-    application_info = Column(JSON, nullable=True)
-    extracted_keywords = Column(JSON, nullable=True)
+    key_responsibilities = Column(JSONType, nullable=True)
+    qualifications = Column(JSONType, nullable=True)
+    compensation_and_benfits = Column(JSONType, nullable=True)
+    application_info = Column(JSONType, nullable=True)
+    extracted_keywords = Column(JSONType, nullable=True)
     processed_at = Column(
         DateTime(timezone=True),
         server_default=text("CURRENT_TIMESTAMP"),
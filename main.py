@@ -2,9 +2,11 @@ import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi_cache import FastAPICache
 
-from core.config import settings, setup_logging
-from core.database import init_models
+from core.config import get_settings, setup_logging
+from core.database import async_engine, init_models, warm_up_pool
 from database.base import Base
 from api.resume_api import resume_router
 from api.job_api import job_router
@@ -12,6 +14,25 @@ from api.job_api import job_router
 # Use your existing logging setup
 setup_logging()
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def _init_cache(app: FastAPI) -> None:
+    """
+    Back the job cache with Redis when ``REDIS_URL`` is set; otherwise leave
+    caching off. fastapi-cache2's in-memory backend never evicts keys that
+    aren't read again, so it would grow without bound in every worker.
+    """
+    if not settings.REDIS_URL:
+        app.state.job_cache_enabled = False
+        return
+    from redis import asyncio as aioredis
+    from fastapi_cache.backends.redis import RedisBackend
+    FastAPICache.init(
+        RedisBackend(aioredis.from_url(settings.REDIS_URL)), prefix="resume-scanner"
+    )
+    app.state.job_cache_enabled = True
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -20,17 +41,21 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Starting up...")
     await init_models(Base)
     logger.info("✅ Database initialized!")
+    await warm_up_pool()
+    _init_cache(app)
 
     yield
 
     # Shutdown code
     logger.info("🛑 Shutting down...")
+    await async_engine.dispose()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="API for uploading and processing resumes",
     version="1.0.0", 
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
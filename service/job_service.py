@@ -1,12 +1,15 @@
 import uuid
 import json
+import asyncio
 import logging
 
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from pydantic import ValidationError
-from sqlalchemy import select
+from sqlalchemy import select, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.config import get_settings
 from database.resume_db import Resume, ProcessedResume
 from database.job_db import Job, ProcessedJob
 from agent.agent_manager import AgentManager
@@ -14,105 +17,157 @@ from prompt.prompt_manager import PromptFactory
 from schema.json.json_manager import JSONSchemaFactory
 from schema.pydantic.structured_resume_pydantic import StructuredResumeModel
 from schema.pydantic.structured_job_pydantic import StructuredJobModel
+from schema.pydantic.job_request_pydantic import JobUploadRequest
 from exception import ResumeNotFoundError, ResumeValidationError, JobNotFoundError
 
 logger = logging.getLogger(__name__)
 
+prompt_factory = PromptFactory()
+json_schema_factory = JSONSchemaFactory()
+
+# Both are static, so resolve the template and serialize the schema once
+# rather than on every LLM request.
+_STRUCTURED_JOB_PROMPT = prompt_factory.get("structured_job")
+_STRUCTURED_JOB_SCHEMA_JSON = json.dumps(
+    json_schema_factory.get("structured_job"), indent=2
+)
+
+_ALLOWED_LOCATIONS = frozenset(
+    {
+        "Fully Remote",
+        "Remote",
+        "Hybrid",
+        "On-site",
+        "Not Specified",
+        "Multiple Locations",
+    }
+)
+
+
+def _normalize_location(loc: Any) -> str:
+    """
+    Map the LLM's ``location`` value onto one of the allowed enum values.
+
+    The LLM sometimes echoes the schema's ``"A | B | C"`` hint or returns an
+    object instead of a string; anything unrecognised becomes "Not Specified".
+    """
+    if not isinstance(loc, str):
+        logger.warning("Non-string location %r, defaulting to 'Not Specified'", loc)
+        return "Not Specified"
+    if loc in _ALLOWED_LOCATIONS:
+        return loc
+    if "|" in loc:
+        for option in loc.split("|"):
+            option = option.strip()
+            if option in _ALLOWED_LOCATIONS:
+                return option
+    return "Not Specified"
+
 
 class JobService:
-    def __init__(self, db: AsyncSession):
-        self.db = db
+    """
+    Stateless service for job ingestion and retrieval.
+
+    Holds only the LLM agent, so a single instance can be shared across
+    requests; the ``AsyncSession`` is passed to each call.
+    """
+
+    def __init__(self):
         self.json_agent_manager = AgentManager()
+        # Caps in-flight LLM calls across all requests sharing this service
+        self._llm_semaphore = asyncio.Semaphore(get_settings().LLM_CONCURRENCY)
 
-    async def create_and_store_job(self, job_data: dict) -> List[str]:
+    async def create_and_store_job(
+        self, db: AsyncSession, job_data: JobUploadRequest
+    ) -> List[str]:
         """
         Stores job data in the database and returns a list of job IDs.
         """
-        resume_id = str(job_data.get("resume_id"))
+        resume_id = str(job_data.resume_id)
 
-        if not await self._is_resume_available(resume_id):
+        if not await self._is_resume_available(db, resume_id):
             raise AssertionError(
                 f"resume corresponding to resume_id: {resume_id} not found"
             )
 
-        job_ids = []
-        for job_description in job_data.get("job_descriptions", []):
-            job_id = str(uuid.uuid4())
-            job = Job(
-                job_id=job_id,
-                resume_id=str(resume_id),
-                content=job_description,
-            )
-            self.db.add(job)
+        job_descriptions = job_data.job_descriptions
+        if not job_descriptions:
+            return []
 
-            await self._extract_and_store_structured_job(
-                job_id=job_id, job_description_text=job_description
-            )
+        job_ids = [str(uuid.uuid4()) for _ in job_descriptions]
+
+        # The LLM calls are independent of each other and of the session,
+        # so run them concurrently and only touch the session afterwards.
+        # TaskGroup cancels the remaining calls as soon as one fails, so a bad
+        # description doesn't keep holding shared LLM semaphore slots.
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(self._extract_structured_json(text))
+                    for text in job_descriptions
+                ]
+        except ExceptionGroup as eg:
+            # Surface the original error (e.g. ValidationError), not the group
+            raise eg.exceptions[0]
+        structured_jobs = [task.result() for task in tasks]
+
+        jobs = [
+            {"job_id": job_id, "resume_id": resume_id, "content": job_description}
+            for job_id, job_description in zip(job_ids, job_descriptions)
+        ]
+        processed_jobs = []
+        for job_id, structured_job in zip(job_ids, structured_jobs):
+            processed_job = self._build_processed_job(job_id, structured_job)
+            if processed_job is not None:
+                processed_jobs.append(processed_job)
             logger.info(f"Job ID: {job_id}")
-            job_ids.append(job_id)
 
-        await self.db.commit()
+        # One executemany INSERT per table instead of one per row; jobs go
+        # first to satisfy the processed_jobs foreign key. Both land in the
+        # same transaction, so a single commit covers the upload.
+        await db.execute(insert(Job), jobs)
+        if processed_jobs:
+            await db.execute(insert(ProcessedJob), processed_jobs)
+        await db.commit()
         return job_ids
 
-    async def _is_resume_available(self, resume_id: str) -> bool:
+    async def _is_resume_available(self, db: AsyncSession, resume_id: str) -> bool:
         """
         Checks if a resume exists in the database.
         """
-        query = select(Resume).where(Resume.resume_id == resume_id)
-        result = await self.db.scalar(query)
+        query = select(1).where(Resume.resume_id == resume_id).limit(1)
+        result = await db.scalar(query)
         return result is not None
  
-    async def _extract_and_store_structured_job(
-        self, job_id, job_description_text: str
-    ):
+    def _build_processed_job(
+        self, job_id: str, structured_job: Dict[str, Any] | None
+    ) -> Dict[str, Any] | None:
         """
-        extract and store structured job data in the database
+        build the ProcessedJob insert parameters for already extracted structured job data
         """
-        structured_job = await self._extract_structured_json(job_description_text)
         if not structured_job:
             logger.info("Structured job extraction failed.")
             return None
 
-        processed_job = ProcessedJob(
-            job_id=job_id,
-            job_title=structured_job.get("job_title"),
-            company_profile=json.dumps(structured_job.get("company_profile"))
-            if structured_job.get("company_profile")
-            else None,
-            location=json.dumps(structured_job.get("location"))
-            if structured_job.get("location")
-            else None,
-            date_posted=structured_job.get("date_posted"),
-            employment_type=structured_job.get("employment_type"),
-            job_summary=structured_job.get("job_summary"),
-            key_responsibilities=json.dumps(
-                {"key_responsibilities": structured_job.get("key_responsibilities", [])}
-            )
-            if structured_job.get("key_responsibilities")
-            else None,
-            qualifications=json.dumps(structured_job.get("qualifications", []))
-            if structured_job.get("qualifications")
-            else None,
-            compensation_and_benfits=json.dumps(
-                structured_job.get("compensation_and_benfits", [])
-            )
-            if structured_job.get("compensation_and_benfits")
-            else None,
-            application_info=json.dumps(structured_job.get("application_info", []))
-            if structured_job.get("application_info")
-            else None,
-            extracted_keywords=json.dumps(
-                {"extracted_keywords": structured_job.get("extracted_keywords", [])}
-            )
-            if structured_job.get("extracted_keywords")
-            else None,
-        )
-
-        self.db.add(processed_job)
-        await self.db.flush()
-        await self.db.commit()
+        # JSON columns take the extracted values as-is; the driver encodes
+        # them, so there's no json.dumps here or json.loads on read.
+        processed_job = {
+            "job_id": job_id,
+            "job_title": structured_job.get("job_title"),
+            "company_profile": structured_job.get("company_profile") or None,
+            "location": structured_job.get("location") or None,
+            "date_posted": structured_job.get("date_posted"),
+            "employment_type": structured_job.get("employment_type"),
+            "job_summary": structured_job.get("job_summary"),
+            "key_responsibilities": structured_job.get("key_responsibilities") or None,
+            "qualifications": structured_job.get("qualifications") or None,
+            "compensation_and_benfits": structured_job.get("compensation_and_benefits")
+            or None,
+            "application_info": structured_job.get("application_info") or None,
+            "extracted_keywords": structured_job.get("extracted_keywords") or None,
+        }
 
-        return job_id
+        return processed_job
 
     # DEBUG: Most likely bug starts here
     async def _extract_structured_json(self, job_description_text: str) -> Dict[str, Any] | None:
@@ -120,63 +175,19 @@ class JobService:
         Uses the AgentManager+JSONWrapper to ask the LLM to
         return the data in exact JSON schema we need.
         """
-        prompt_template = prompt_factory.get("structured_job")
-        prompt = prompt_template.format(
-            json.dumps(json_schema_factory.get("structured_job"), indent=2),
+        prompt = _STRUCTURED_JOB_PROMPT.format(
+            _STRUCTURED_JOB_SCHEMA_JSON,
             job_description_text,
         )
         logger.info(f"Structured Job Prompt: {prompt}")
-        raw_output = await self.json_agent_manager.run(prompt=prompt)
+        async with self._llm_semaphore:
+            raw_output = await self.json_agent_manager.run(prompt=prompt)
 
         # Debug: Log the raw output received from the agent
         logger.info(f"Raw output from JSON agent: {raw_output}")
 
-        # Normalize location field to allowed enum values
-        allowed_locations = {
-            "Fully Remote": "Fully Remote",
-            "Remote": "Remote",
-            "Hybrid": "Hybrid",
-            "On-site": "On-site",
-            "Not Specified": "Not Specified",
-            "Multiple Locations": "Multiple Locations"
-        }
         if isinstance(raw_output, dict) and "location" in raw_output:
-
-            # Retrieve "location" from raw_output
-            loc = raw_output["location"]
-            
-             # --- START: ENHANCED NORMALIZATION LOGIC ---
-            try: 
-                # Happy path: loc is a string
-                if loc not in allowed_locations:
-                    # Set the dictionary to a string value 
-                    raw_output["location"] = "Not Specified"
-            except TypeError:
-                logger.warning(
-                    f"Caught a TypeError for the 'location' field."
-                    f"The LLM likely returned a dictionary instead of a string."
-                    f"Value received: {loc}. Defaulting to 'Not Specified'."
-                    )
-            # --- END: ENHANCED NORMALIZATION LOGIC --- 
-
-            # --- START: VERIFICATION LOGGING ---
-            # Add this blog to verify the loc instance before normalization
-            logger.info("--- VERIFYING 'loc' VARIABLE ---") 
-            logger.info(f"Value of loc: {loc}")
-            logger.info(f"Type of loc: {type(loc)}")
-            logger.info("--------------------------------")
-            # --- END: VERIFICATION LOGGING ---
-            
-            if isinstance(loc, str) and "|" in loc:
-                loc_options = [l.strip() for l in loc.split("|")]
-                for option in loc_options:
-                    if option in allowed_locations:
-                        raw_output["location"] = allowed_locations[option]
-                        break
-                    else:
-                        raw_output["location"] = "Not Specified"
-            elif loc not in allowed_locations:
-                raw_output["location"] = "Not Specified"
+            raw_output["location"] = _normalize_location(raw_output["location"])
 
         try:
             structured_job: StructuredJobModel = StructuredJobModel.model_validate(
@@ -197,13 +208,18 @@ class JobService:
             logger.error(f"Pydantic Validation Error: {e}")
             raise e
 
-        return structured_job.model_dump(mode="json")
+        # Python-mode dump: the values go straight into JSON columns, which
+        # the driver encodes itself, so the JSON-mode conversion pass is wasted.
+        return structured_job.model_dump()
 
-    async def get_job_with_processed_data(self, job_id: str) -> Optional[Dict]:
+    async def get_job_with_processed_data(
+        self, db: AsyncSession, *, job_id: str
+    ) -> Optional[Dict]:
         """
         Fetches both job and processed job data from the database and combines them.
 
         Args:
+            db: The session to query with
             job_id: The ID of the job to retrieve
 
         Returns:
@@ -212,42 +228,72 @@ class JobService:
         Raises:
             JobNotFoundError: If the job is not found
         """
-        job_query = select(Job).where(Job.job_id == job_id)
-        job_result = await self.db.execute(job_query)
-        job = job_result.scalars().first()
+        # Plain column rows rather than ORM entities: the result is copied
+        # straight into a dict, so identity-map bookkeeping is wasted work.
+        query = (
+            select(
+                Job.id,
+                Job.job_id,
+                Job.resume_id,
+                Job.content,
+                Job.created_at,
+                ProcessedJob.job_id.label("processed_job_id"),
+                ProcessedJob.job_title,
+                ProcessedJob.company_profile,
+                ProcessedJob.location,
+                ProcessedJob.date_posted,
+                ProcessedJob.employment_type,
+                ProcessedJob.job_summary,
+                ProcessedJob.key_responsibilities,
+                ProcessedJob.qualifications,
+                ProcessedJob.compensation_and_benfits,
+                ProcessedJob.application_info,
+                ProcessedJob.extracted_keywords,
+                ProcessedJob.processed_at,
+            )
+            .select_from(Job)
+            .outerjoin(ProcessedJob, Job.job_id == ProcessedJob.job_id)
+            .where(Job.job_id == job_id)
+        )
+        result = await db.execute(query)
+        row = result.one_or_none()
 
-        if not job:
+        if row is None:
             raise JobNotFoundError(job_id=job_id)
 
-        processed_query = select(ProcessedJob).where(ProcessedJob.job_id == job_id)
-        processed_result = await self.db.execute(processed_query)
-        processed_job = processed_result.scalars().first()
+        job = row._mapping
 
         combined_data = {
-            "job_id": job.job_id,
+            "job_id": job["job_id"],
             "raw_job": {
-                "id": job.id,
-                "resume_id": job.resume_id,
-                "content": job.content,
-                "created_at": job.created_at.isoformat() if job.created_at else None,
+                "id": job["id"],
+                "resume_id": job["resume_id"],
+                "content": job["content"],
+                "created_at": job["created_at"].isoformat() if job["created_at"] else None,
             },
             "processed_job": None
         }
 
-        if processed_job:
+        if job["processed_job_id"] is not None:
             combined_data["processed_job"] = {
-                "job_title": processed_job.job_title,
-                "company_profile": json.loads(processed_job.company_profile) if processed_job.company_profile else None,
-                "location": json.loads(processed_job.location) if processed_job.location else None,
-                "date_posted": processed_job.date_posted,
-                "employment_type": processed_job.employment_type,
-                "job_summary": processed_job.job_summary,
-                "key_responsibilities": json.loads(processed_job.key_responsibilities).get("key_responsibilities", []) if processed_job.key_responsibilities else None,
-                "qualifications": json.loads(processed_job.qualifications).get("qualifications", []) if processed_job.qualifications else None,
-                "compensation_and_benfits": json.loads(processed_job.compensation_and_benfits).get("compensation_and_benfits", []) if processed_job.compensation_and_benfits else None,
-                "application_info": json.loads(processed_job.application_info).get("application_info", []) if processed_job.application_info else None,
-                "extracted_keywords": json.loads(processed_job.extracted_keywords).get("extracted_keywords", []) if processed_job.extracted_keywords else None,
-                "processed_at": processed_job.processed_at.isoformat() if processed_job.processed_at else None,
+                "job_title": job["job_title"],
+                "company_profile": job["company_profile"],
+                "location": job["location"],
+                "date_posted": job["date_posted"],
+                "employment_type": job["employment_type"],
+                "job_summary": job["job_summary"],
+                "key_responsibilities": job["key_responsibilities"],
+                "qualifications": job["qualifications"],
+                "compensation_and_benfits": job["compensation_and_benfits"],
+                "application_info": job["application_info"],
+                "extracted_keywords": job["extracted_keywords"],
+                "processed_at": job["processed_at"].isoformat() if job["processed_at"] else None,
             }
 
-        return combined_data
\ No newline at end of file
+        return combined_data
+
+
+@lru_cache(maxsize=1)
+def get_job_service() -> JobService:
+    """Return the process-wide ``JobService``, built on first use."""
+    return JobService()
@@ -66,16 +66,13 @@ class ScoreImprovementService:
         """
         Validates that keyword extraction was successful for a job.
         Raises JobKeywordExtractionError if keywords are missing or empty.
-        """
-        if not processed_job.extracted_keywords:
-            raise JobKeywordExtractionError(job_id=job_id)
 
-        try:
-            keywords_data = json.loads(processed_job.extracted_keywords)
-            keywords = keywords_data.get("extracted_keywords", [])
-            if not keywords or len(keywords) == 0:
-                raise JobKeywordExtractionError(job_id=job_id)
-        except json.JSONDecodeError:
+        Rows written before the JSON column change hold a JSON-encoded string
+        instead of a list; those are rejected too, so the job gets reprocessed
+        rather than having its characters joined into the prompt.
+        """
+        keywords = processed_job.extracted_keywords
+        if not isinstance(keywords, list) or not keywords:
             raise JobKeywordExtractionError(job_id=job_id)
 
     async def _get_resume(
@@ -232,9 +229,7 @@ class ScoreImprovementService:
 
         job, processed_job = await self._get_job(job_id)
 
-        extracted_job_keywords = ", ".join(
-            json.loads(processed_job.extracted_keywords).get("extracted_keywords", [])
-        )
+        extracted_job_keywords = ", ".join(processed_job.extracted_keywords)
 
         extracted_resume_keywords = ", ".join(
             json.loads(processed_resume.extracted_keywords).get(
@@ -314,9 +309,7 @@ class ScoreImprovementService:
         yield f"data: {json.dumps({'status': 'parsing', 'message': 'Parsing resume content...'})}\n\n"
         await asyncio.sleep(2)
 
-        extracted_job_keywords = ", ".join(
-            json.loads(processed_job.extracted_keywords).get("extracted_keywords", [])
-        )
+        extracted_job_keywords = ", ".join(processed_job.extracted_keywords)
 
         extracted_resume_keywords = ", ".join(
             json.loads(processed_resume.extracted_keywords).get(